@@ -21,9 +21,6 @@ from .framework.workflow_unified import (
     get_registered_workflows
 )
 
-# Backward compatibility exports
-from .framework.engine import WorkflowRunner
-
 __all__ = [
     'Workflow',
     'step', 
@@ -35,4 +32,16 @@ __all__ = [
     'register_workflow',
     'get_registered_workflows',
     'WorkflowRunner'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Backward compatibility export, loaded on first use.
+
+    WorkflowRunner pulls in rich and dotenv; workflow modules only need the
+    decorators above, so importing them should not pay for the engine.
+    """
+    if name == 'WorkflowRunner':
+        from .framework.engine import WorkflowRunner
+        return WorkflowRunner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -93,6 +93,8 @@ class WorkflowRunner:
         self.output_format = output_format
         self.steps: List[Dict] = []
         self.results: List[StepResult] = []
+        # Set once any executed step fails, so stop_on_failure checks don't rescan results
+        self._any_failed = False
         self.thread_pool = ThreadPoolExecutor()
 
         # Load configurations
@@ -138,7 +140,7 @@ class WorkflowRunner:
             return result
 
         # Check if we should stop due to previous failure
-        if self.stop_on_failure and any(not r.success and not r.skipped for r in self.results):
+        if self.stop_on_failure and self._any_failed:
             result.skipped = True
             result.message = "Skipped due to previous failure"
             return result
@@ -230,7 +232,7 @@ class WorkflowRunner:
         # Process groups sequentially, steps within groups in parallel
         for group_key, group_steps in groups.items():
             # Skip group if previous failure and stop_on_failure enabled
-            if self.stop_on_failure and any(not r.success and not r.skipped for r in self.results):
+            if self.stop_on_failure and self._any_failed:
                 for step in group_steps:
                     result = StepResult(step["name"])
                     result.skipped = True
@@ -246,6 +248,8 @@ class WorkflowRunner:
 
             for result in group_results:
                 self.results.append(result)
+                if not result.success and not result.skipped:
+                    self._any_failed = True
                 if self.output_format == "json":
                     continue
 
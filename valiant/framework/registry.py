@@ -17,6 +17,8 @@ def get_workflow_class_path(name: str) -> Optional[str]:
                 # Handle class objects from auto-discovery
                 cls = workflows[name]
                 return f"{cls.__module__}.{cls.__name__}"
+        # get_all_workflows() already includes WORKFLOWS, no need to look again
+        return None
     except ImportError:
         pass
     
@@ -2,6 +2,7 @@ import requests
 import subprocess
 import sqlalchemy
 from typing import Tuple, Dict, Any, Optional
+import functools
 import json
 
 
@@ -112,14 +113,19 @@ def run_cli(
     except Exception as e:
         return False, f"CLI error: {str(e)}"
 
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-notation path once; check/set_values paths repeat across calls"""
+    return tuple(path.split('.'))
+
+
 def get_nested(data: dict, path: str, default: Any = None) -> Any:
     """
     Access nested dictionary values using dot notation
     Example: get_nested(response, "user.address.city")
     """
-    keys = path.split('.')
     value = data
-    for key in keys:
+    for key in _split_path(path):
         if isinstance(value, dict) and key in value:
             value = value[key]
         else:
@@ -15,6 +15,9 @@ import functools
 from abc import ABC, abstractmethod
 
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
 class InputType(Enum):
     """Input field types for workflow parameters"""
     TEXT = "text"
@@ -27,7 +30,7 @@ class InputType(Enum):
     CHECKBOX = "checkbox"
 
 
-@dataclass
+@dataclass(slots=True)
 class InputField:
     """Input field definition for workflows"""
     name: str
@@ -41,6 +44,7 @@ class InputField:
     max_value: Optional[float] = None
     validation_regex: Optional[str] = None
     validation_message: Optional[str] = None
+    _validation_pattern: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Post-initialization to set defaults and convert types"""
@@ -50,6 +54,10 @@ class InputField:
         # Convert string types to enum
         if isinstance(self.type, str):
             self.type = InputType(self.type)
+        
+        # Compile the custom regex once instead of on every validate_value call
+        if self.validation_regex:
+            self._validation_pattern = re.compile(self.validation_regex)
     
     def validate_value(self, value: Any) -> Tuple[bool, str]:
         """Validate a value against this field's constraints"""
@@ -74,18 +82,18 @@ class InputField:
                 return False, f"{self.label} must be one of: {', '.join(self.options)}"
         
         elif self.type == InputType.EMAIL:
-            if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', str(value)):
+            if not _EMAIL_RE.match(str(value)):
                 return False, f"{self.label} must be a valid email address"
         
-        if self.validation_regex:
-            if not re.match(self.validation_regex, str(value)):
+        if self._validation_pattern:
+            if not self._validation_pattern.match(str(value)):
                 message = self.validation_message or f"{self.label} format is invalid"
                 return False, message
         
         return True, ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Unified step result with simplified interface"""
     name: str
@@ -112,6 +120,13 @@ class StepResult:
             self.tags.append(tag)
         return self
     
+    def add_tags(self, *tags: str) -> 'StepResult':
+        """Add several tags to the result in one call"""
+        for tag in tags:
+            if tag not in self.tags:
+                self.tags.append(tag)
+        return self
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary"""
         return {
@@ -157,6 +172,63 @@ class StepConfig:
     condition: Optional[str] = None
 
 
+def _to_step_result(step_name: str, result: Any) -> StepResult:
+    """Normalize a step's return value into a StepResult"""
+    if isinstance(result, StepResult):
+        return result
+    elif isinstance(result, tuple) and len(result) == 3:
+        success, message, data = result
+        return StepResult(step_name, success, message, data)
+    else:
+        return StepResult(step_name, False, f"Invalid return type: {type(result)}")
+
+
+def _failed_step_result(step_name: str, error: Exception) -> StepResult:
+    """Build the result for a step that raised"""
+    return StepResult(
+        step_name, 
+        success=False, 
+        message=f"Step execution failed: {str(error)}", 
+        exception=error
+    )
+
+
+def _check_preconditions(config: StepConfig, context: Dict) -> Optional[StepResult]:
+    """Return the early result for a step whose condition or requires are unmet"""
+    # Check condition if specified
+    if config.condition and not context.get(config.condition):
+        return StepResult(config.name, success=True, message="Step skipped due to condition", skipped=True)
+    
+    # Check required context keys
+    missing_keys = [key for key in config.requires if key not in context]
+    if missing_keys:
+        return StepResult(
+            config.name,
+            success=False,
+            message=f"Missing required context keys: {', '.join(missing_keys)}"
+        )
+    
+    return None
+
+
+def _annotate(config: StepConfig, result: StepResult) -> StepResult:
+    """Add a step's configured tags and metadata to its result"""
+    # Add configuration tags
+    result.add_tags(*config.tags)
+    
+    # Add metadata
+    result.metadata.update({
+        "step_priority": config.priority.name,
+        "step_order": config.order,
+        "step_description": config.description,
+        "timeout": config.timeout,
+        "retries": config.retries,
+        "parallel_group": config.parallel_group
+    })
+    
+    return result
+
+
 def step(
     name: Optional[str] = None,
     order: int = 0,
@@ -173,6 +245,9 @@ def step(
     """
     Decorator for workflow step methods.
     
+    The decorated method may be a regular function or an ``async def``
+    coroutine; async steps are awaited on the runner's event loop.
+    
     Args:
         name: Step name (defaults to method name)
         order: Execution order (lower numbers execute first)
@@ -205,27 +280,22 @@ def step(
         func._step_config = config
         func._is_workflow_step = True
         
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                result = func(*args, **kwargs)
-                
-                # Handle different return types
-                if isinstance(result, StepResult):
-                    return result
-                elif isinstance(result, tuple) and len(result) == 3:
-                    success, message, data = result
-                    return StepResult(step_name, success, message, data)
-                else:
-                    return StepResult(step_name, False, f"Invalid return type: {type(result)}")
-                    
-            except Exception as e:
-                return StepResult(
-                    step_name, 
-                    success=False, 
-                    message=f"Step execution failed: {str(e)}", 
-                    exception=e
-                )
+        # async def steps get an async wrapper so the runner awaits them on its
+        # event loop instead of handing them to the thread pool
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return _to_step_result(step_name, await func(*args, **kwargs))
+                except Exception as e:
+                    return _failed_step_result(step_name, e)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return _to_step_result(step_name, func(*args, **kwargs))
+                except Exception as e:
+                    return _failed_step_result(step_name, e)
         
         return wrapper
     
@@ -252,26 +322,47 @@ class Workflow:
     def inputs(self) -> List[InputField]:
         """
         Define input fields for this workflow.
-        Override this method to specify required inputs.
+        Override this method to specify required inputs. The result is
+        cached per workflow class, so it must not depend on instance state.
         """
         return []
     
+    # Plain methods rather than properties: _discover_steps getattr()s every
+    # attribute, and a property there would run inputs() as a side effect
+    def _input_fields(self) -> Tuple[InputField, ...]:
+        """Input fields built once per workflow class"""
+        cls = type(self)
+        # Look in the class's own __dict__ so subclasses don't reuse a parent's cache
+        fields = cls.__dict__.get("_input_fields_cache")
+        if fields is None:
+            fields = tuple(self.inputs())
+            cls._input_fields_cache = fields
+        return fields
+    
+    def _required_inputs(self) -> Tuple[Tuple[str, str, bool], ...]:
+        """Legacy (prompt, key, is_secret) tuples derived from the cached fields"""
+        cls = type(self)
+        required = cls.__dict__.get("_required_inputs_cache")
+        if required is None:
+            required = tuple(
+                (field.label or field.name, field.name, field.type == InputType.PASSWORD)
+                for field in self._input_fields()
+            )
+            cls._required_inputs_cache = required
+        return required
+    
     def get_input_fields(self) -> List[InputField]:
         """Get input fields (compatibility method)"""
-        return self.inputs()
+        return list(self._input_fields())
     
     def get_required_inputs(self) -> List[Tuple[str, str, bool]]:
         """Get required inputs in legacy format for CLI compatibility"""
-        input_fields = self.inputs()
-        return [
-            (field.label or field.name, field.name, field.type == InputType.PASSWORD)
-            for field in input_fields
-        ]
+        return list(self._required_inputs())
     
     def validate_inputs(self, inputs: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """Validate workflow inputs"""
         errors = []
-        for field in self.inputs():
+        for field in self._input_fields():
             value = inputs.get(field.name)
             is_valid, error_message = field.validate_value(value)
             if not is_valid:
@@ -316,79 +407,58 @@ class Workflow:
         if not config.enabled:
             return
         
-        def step_wrapper(context: Dict) -> Union[StepResult, Tuple[bool, str, Any]]:
-            # Check condition if specified
-            if config.condition and not context.get(config.condition):
-                return StepResult(config.name, success=True, message="Step skipped due to condition", skipped=True)
-            
-            # Check required context keys
-            missing_keys = [key for key in config.requires if key not in context]
-            if missing_keys:
-                return StepResult(
-                    config.name,
-                    success=False,
-                    message=f"Missing required context keys: {', '.join(missing_keys)}"
-                )
-            
-            try:
-                result = step_func(context)
-                
-                if isinstance(result, StepResult):
-                    # Add configuration tags
-                    for tag in config.tags:
-                        result.add_tag(tag)
-                    
-                    # Add metadata
-                    result.metadata.update({
-                        "step_priority": config.priority.name,
-                        "step_order": config.order,
-                        "step_description": config.description,
-                        "timeout": config.timeout,
-                        "retries": config.retries,
-                        "parallel_group": config.parallel_group
-                    })
-                    
-                    return result
-                
-                elif isinstance(result, tuple) and len(result) == 3:
-                    success, message, data = result
-                    step_result = StepResult(config.name, success, message, data)
-                    for tag in config.tags:
-                        step_result.add_tag(tag)
-                    return step_result
-                
-                else:
-                    return StepResult(
-                        config.name,
-                        success=False,
-                        message=f"Invalid return type from step: {type(result)}"
-                    )
-                    
-            except Exception as e:
-                return StepResult(
-                    config.name,
-                    success=False,
-                    message=f"Step failed with exception: {str(e)}",
-                    exception=e
-                )
+        # step_func is always @step-wrapped (see _discover_steps), and that
+        # wrapper already turns exceptions and tuple returns into a StepResult
+        if inspect.iscoroutinefunction(step_func):
+            async def step_wrapper(context: Dict) -> StepResult:
+                early_result = _check_preconditions(config, context)
+                if early_result is not None:
+                    return early_result
+                return _annotate(config, await step_func(context))
+        else:
+            def step_wrapper(context: Dict) -> StepResult:
+                early_result = _check_preconditions(config, context)
+                if early_result is not None:
+                    return early_result
+                return _annotate(config, step_func(context))
         
         if self.runner:
+            # config.requires lists context keys and is checked by step_wrapper;
+            # the runner's own requires= means step names, so it is not forwarded
             self.runner.add_step(
                 name=config.name,
                 func=step_wrapper,
-                requires=config.requires,
                 parallel_group=config.parallel_group,
                 timeout=config.timeout,
                 retries=config.retries
             )
     
-    def success(self, message: str, data: Any = None) -> StepResult:
-        """Create a successful step result"""
-        return StepResult(name="", success=True, message=message, data=data)
+    def success(
+        self,
+        message: str,
+        data: Any = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None
+    ) -> StepResult:
+        """Create a successful step result, optionally with metrics and tags"""
+        return StepResult(
+            name="", success=True, message=message, data=data,
+            metrics=metrics or {}, tags=tags or []
+        )
     
-    def failure(self, message: str, data: Any = None, error: Optional[Exception] = None) -> StepResult:
-        """Create a failed step result"""
-        return StepResult(name="", success=False, message=message, data=data, exception=error)
+    def failure(
+        self,
+        message: str,
+        data: Any = None,
+        error: Optional[Exception] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None
+    ) -> StepResult:
+        """Create a failed step result, optionally with metrics and tags"""
+        return StepResult(
+            name="", success=False, message=message, data=data, exception=error,
+            metrics=metrics or {}, tags=tags or []
+        )
     
     def skip(self, message: str = "Step skipped") -> StepResult:
         """Create a skipped step result"""
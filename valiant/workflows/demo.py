@@ -5,9 +5,14 @@ This workflow demonstrates the simplified, unified approach to creating
 workflows in Valiant with clean decorators and simple return values.
 """
 
+import zlib
 from typing import Dict
 from valiant import Workflow, step, InputField, InputType, workflow
 
+# Shared by inputs() and validate_input so both apply the framework's email rule
+_EMAIL_FIELD = InputField("user_email", type="email", required=True,
+                          help_text="Email address for notifications")
+
 
 @workflow("demo")
 class DemoWorkflow(Workflow):
@@ -24,8 +29,7 @@ class DemoWorkflow(Workflow):
         return [
             InputField("user_name", type="text", required=True, 
                       help_text="Name of the user to process"),
-            InputField("user_email", type="email", required=True,
-                      help_text="Email address for notifications"),
+            _EMAIL_FIELD,
             InputField("processing_mode", type="select", 
                       options=["basic", "advanced", "expert"], default="basic",
                       help_text="Level of processing to perform"),
@@ -47,50 +51,44 @@ class DemoWorkflow(Workflow):
         if len(user_name) < 2:
             return self.failure("User name must be at least 2 characters")
         
-        if not user_email or "@" not in user_email:
+        if not _EMAIL_FIELD.validate_value(user_email)[0]:
             return self.failure("Valid email address is required")
+        email = user_email.lower()
         
-        # Store validated data
+        # Store validated data (crc32 keeps the id stable across runs, unlike hash())
         context["validated_user"] = {
             "name": user_name.title(),
-            "email": user_email.lower(),
-            "id": f"user_{hash(user_email) % 10000}"
+            "email": email,
+            "id": f"user_{zlib.crc32(email.encode()) % 10000}"
         }
         
-        result = self.success(f"Input validated for user: {user_name}")
-        result.add_metric("user_name_length", len(user_name))
-        result.add_metric("email_domain", user_email.split("@")[1])
-        result.add_tag("input-validation")
-        
-        return result
+        return self.success(
+            f"Input validated for user: {user_name}",
+            metrics={"user_name_length": len(user_name), "email_domain": email.rpartition("@")[2]},
+            tags=["input-validation"]
+        )
     
-    @step("Process Data", order=2, tags=["processing"])
+    @step("Process Data", order=2, requires=["validated_user"], tags=["processing"])
     def process_data(self, context: Dict):
         """Process user data based on selected mode"""
-        user = context.get("validated_user", {})
+        user = context["validated_user"]
         mode = context.get("processing_mode", "basic")
         max_items = int(context.get("max_items", 10))
         
-        if not user:
-            return self.failure("No validated user data found")
-        
-        # Simulate different processing modes
-        processed_items = []
-        complexity = "unknown"  # Initialize with default value
-        
+        # Simulate different processing modes; the item count is known upfront
         if mode == "basic":
-            processed_items = [f"Item {i+1} for {user['name']}" for i in range(min(max_items, 5))]
-            complexity = "low"
+            n, prefix, suffix, complexity = min(max_items, 5), "Item", f" for {user['name']}", "low"
         elif mode == "advanced":
-            processed_items = [f"Advanced Item {i+1}: {user['email']}" for i in range(min(max_items, 10))]
-            complexity = "medium"
+            n, prefix, suffix, complexity = min(max_items, 10), "Advanced Item", f": {user['email']}", "medium"
         elif mode == "expert":
-            processed_items = [f"Expert Item {i+1}: ID-{user['id']}" for i in range(max_items)]
-            complexity = "high"
+            n, prefix, suffix, complexity = max_items, "Expert Item", f": ID-{user['id']}", "high"
         else:
             # Handle unexpected mode values
-            processed_items = [f"Default Item {i+1}" for i in range(min(max_items, 3))]
-            complexity = "default"
+            n, prefix, suffix, complexity = min(max_items, 3), "Default Item", "", "default"
+        
+        processed_items = [None] * n
+        for i in range(n):
+            processed_items[i] = f"{prefix} {i + 1}{suffix}"
         
         context["processed_data"] = {
             "items": processed_items,
@@ -99,30 +97,25 @@ class DemoWorkflow(Workflow):
             "user_id": user["id"]
         }
         
-        result = self.success(f"Processed {len(processed_items)} items in {mode} mode")
-        result.add_metric("items_processed", len(processed_items))
-        result.add_metric("processing_mode", mode)
-        result.add_metric("complexity_level", complexity)
-        result.add_tag("data-processing")
-        result.add_tag(f"mode-{mode}")
-        
-        return result
+        return self.success(
+            f"Processed {len(processed_items)} items in {mode} mode",
+            metrics={
+                "items_processed": len(processed_items),
+                "processing_mode": mode,
+                "complexity_level": complexity
+            },
+            tags=["data-processing", f"mode-{mode}"]
+        )
     
-    @step("Generate Report", order=3, tags=["reporting"])
+    @step("Generate Report", order=3, requires=["validated_user", "processed_data"], tags=["reporting"])
     def generate_report(self, context: Dict):
         """Generate processing report"""
-        user = context.get("validated_user", {})
-        processed = context.get("processed_data", {})
-        
-        if not user or not processed:
-            return self.failure("Missing required data for report generation")
+        user = context["validated_user"]
+        processed = context["processed_data"]
         
+        # validated_user already has exactly the report's user fields, share it
         report = {
-            "user_info": {
-                "name": user["name"],
-                "email": user["email"],
-                "id": user["id"]
-            },
+            "user_info": user,
             "processing_summary": {
                 "mode": processed["mode"],
                 "items_processed": processed["count"],
@@ -137,39 +130,35 @@ class DemoWorkflow(Workflow):
         
         context["final_report"] = report
         
-        result = self.success(f"Report generated for {user['name']}")
-        result.add_metric("report_sections", len(report))
-        result.add_metric("summary_items", len(report["processing_summary"]["items"]))
-        result.add_tag("reporting")
-        
-        return result
+        return self.success(
+            f"Report generated for {user['name']}",
+            metrics={
+                "report_sections": len(report),
+                "summary_items": len(report["processing_summary"]["items"])
+            },
+            tags=["reporting"]
+        )
     
-    @step("Send Notification", order=4, condition="send_notification", tags=["notification"])
+    @step("Send Notification", order=4, condition="send_notification",
+          requires=["validated_user", "processed_data"], tags=["notification"])
     def send_notification(self, context: Dict):
         """Send completion notification if enabled"""
-        user = context.get("validated_user", {})
-        processed = context.get("processed_data", {})
-        
-        if not context.get("send_notification"):
-            return self.skip("Notification disabled by user")
-        
-        if not user:
-            return self.failure("No user data available for notification")
+        # condition= and requires= are both checked by the framework before this runs
+        user = context["validated_user"]
+        processed = context["processed_data"]
         
         # Simulate sending notification
         notification_content = {
             "to": user["email"],
             "subject": f"Processing Complete for {user['name']}",
-            "message": f"Successfully processed {processed.get('count', 0)} items",
+            "message": f"Successfully processed {processed['count']} items",
             "type": "completion"
         }
         
         context["notification_sent"] = notification_content
         
-        result = self.success(f"Notification sent to {user['email']}")
-        result.add_metric("notification_type", "email")
-        result.add_metric("recipient_count", 1)
-        result.add_tag("notification")
-        result.add_tag("email")
-        
-        return result
\ No newline at end of file
+        return self.success(
+            f"Notification sent to {user['email']}",
+            metrics={"notification_type": "email", "recipient_count": 1},
+            tags=["notification", "email"]
+        )
\ No newline at end of file
@@ -2,10 +2,26 @@
 User Management Workflow - Simplified user operations using unified framework
 """
 
+import zlib
+from datetime import datetime, timezone
+from enum import IntEnum
 from typing import Dict
 from valiant import Workflow, step, InputField, workflow
 
 
+# Shared by inputs() and validate_user_data so both apply the framework's email rule
+_EMAIL_FIELD = InputField("email", type="email", required=True,
+                          help_text="User's email address")
+
+
+class UserAction(IntEnum):
+    """Known user actions, resolved once during validation"""
+    CREATE = 0
+    UPDATE = 1
+    DELETE = 2
+    VERIFY = 3
+
+
 @workflow("user_management")
 class UserManagementWorkflow(Workflow):
     """Simple user management operations"""
@@ -15,12 +31,29 @@ class UserManagementWorkflow(Workflow):
     version = "2.0.0"
     tags = ["user", "management", "admin"]
     
+    # action -> (assigns a user id, result message template)
+    _ACTIONS = {
+        UserAction.CREATE: (True, "User account created for %s"),
+        UserAction.UPDATE: (True, "User account updated for %s"),
+        UserAction.DELETE: (False, "User account deleted for %s"),
+        UserAction.VERIFY: (True, "User account verified for %s"),
+    }
+    
+    # (log field, source index, source key); sources are (action_result, validated_user, context)
+    _LOG_KEYMAP = (
+        ("timestamp", 0, "timestamp"),
+        ("action", 0, "action"),
+        ("username", 0, "username"),
+        ("email", 1, "email"),
+        ("role", 1, "role"),
+        ("user_id", 2, "user_id"),
+    )
+    
     def inputs(self):
         return [
             InputField("username", type="text", required=True,
                       help_text="Username for the account"),
-            InputField("email", type="email", required=True,
-                      help_text="User's email address"),
+            _EMAIL_FIELD,
             InputField("action", type="select", 
                       options=["create", "update", "delete", "verify"],
                       default="create", help_text="Action to perform"),
@@ -32,95 +65,83 @@ class UserManagementWorkflow(Workflow):
     @step("Validate User Data", order=1, tags=["validation"])
     def validate_user_data(self, context: Dict):
         """Validate user input data"""
-        username = context.get("username", "").strip()
-        email = context.get("email", "").strip()
         action = context.get("action")
         
-        if not username or len(username) < 3:
+        username = context.get("username", "").strip()
+        if len(username) < 3:
             return self.failure("Username must be at least 3 characters")
+        username = username.lower()
         
-        if not email or "@" not in email:
+        email = context.get("email", "").strip()
+        if not _EMAIL_FIELD.validate_value(email)[0]:
             return self.failure("Valid email address is required")
+        email = email.lower()
+        
+        try:
+            action_code = UserAction[str(action).upper()]
+        except KeyError:
+            return self.failure(f"Unknown action: {action}")
         
         # Store validated data
         context["validated_user"] = {
-            "username": username.lower(),
-            "email": email.lower(),
-            "action": action,
+            "username": username,
+            "email": email,
+            "action": action_code.name.lower(),
             "role": context.get("role", "user")
         }
         
-        result = self.success(f"User data validated for {username}")
-        result.add_metric("username_length", len(username))
-        result.add_tag("validation")
-        
-        return result
+        return self.success(
+            f"User data validated for {username}",
+            metrics={"username_length": len(username)},
+            tags=["validation"]
+        )
     
     @step("Execute User Action", order=2, tags=["processing"])
     def execute_user_action(self, context: Dict):
         """Execute the requested user action"""
-        user_data = context.get("validated_user", {})
-        action = user_data.get("action")
-        username = user_data.get("username")
-        
+        user_data = context.get("validated_user")
         if not user_data:
             return self.failure("No validated user data found")
+        action = user_data["action"]
+        username = user_data["username"]
         
-        # Simulate different actions
-        if action == "create":
-            result_message = f"User account created for {username}"
-            context["user_id"] = f"user_{hash(username) % 10000}"
-        elif action == "update":
-            result_message = f"User account updated for {username}"
-            context["user_id"] = f"user_{hash(username) % 10000}"
-        elif action == "delete":
-            result_message = f"User account deleted for {username}"
-            context["user_id"] = None
-        elif action == "verify":
-            result_message = f"User account verified for {username}"
-            context["user_id"] = f"user_{hash(username) % 10000}"
-        else:
-            return self.failure(f"Unknown action: {action}")
+        # Simulate different actions; validate_user_data already rejected unknown ones
+        assigns_uid, message = self._ACTIONS[UserAction[action.upper()]]
+        
+        # crc32 is stable across runs (unlike the salted str hash)
+        context["user_id"] = f"user_{zlib.crc32(username.encode()) % 10000}" if assigns_uid else None
+        result_message = message % username
         
         context["action_result"] = {
             "action": action,
             "username": username,
             "success": True,
-            "timestamp": "2025-10-02T00:00:00Z"
+            # Taken once per run; log_activity reuses it from action_result
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds")
         }
         
-        result = self.success(result_message)
-        result.add_metric("action_type", action)
-        result.add_metric("user_role", user_data.get("role"))
-        result.add_tag("user-management")
-        result.add_tag(f"action-{action}")
-        
-        return result
+        return self.success(
+            result_message,
+            metrics={"action_type": action, "user_role": user_data["role"]},
+            tags=["user-management", f"action-{action}"]
+        )
     
     @step("Log Activity", order=3, tags=["logging"])
     def log_activity(self, context: Dict):
         """Log the user management activity"""
-        user_data = context.get("validated_user", {})
-        action_result = context.get("action_result", {})
-        
+        action_result = context.get("action_result")
         if not action_result:
             return self.failure("No action result to log")
+        user_data = context.get("validated_user") or {}
         
-        log_entry = {
-            "timestamp": action_result.get("timestamp"),
-            "action": action_result.get("action"),
-            "username": action_result.get("username"),
-            "email": user_data.get("email"),
-            "role": user_data.get("role"),
-            "status": "completed",
-            "user_id": context.get("user_id")
-        }
+        sources = (action_result, user_data, context)
+        log_entry = {out: sources[i].get(key) for out, i, key in self._LOG_KEYMAP}
+        log_entry["status"] = "completed"
         
         context["activity_log"] = log_entry
         
-        result = self.success("Activity logged successfully")
-        result.add_metric("log_entries", 1)
-        result.add_tag("logging")
-        result.add_tag("audit")
-        
-        return result
\ No newline at end of file
+        return self.success(
+            "Activity logged successfully",
+            metrics={"log_entries": 1},
+            tags=["logging", "audit"]
+        )
\ No newline at end of file